@@ -1,12 +1,26 @@
-from typing import Dict, Any, AsyncIterator
+from types import MappingProxyType
+from typing import Dict, Any, AsyncIterator, Mapping
 from app.adapters.base import BaseAdapter
 
+# Static model list, built once at import and frozen so list_models
+# hands every caller the same immutable payload.
+_MODELS = MappingProxyType({
+    "object": "list",
+    "data": (
+        MappingProxyType({"id": "gpt-4", "object": "model", "owned_by": "azure-openai"}),
+        MappingProxyType({"id": "gpt-35-turbo", "object": "model", "owned_by": "azure-openai"}),
+    ),
+})
+
 
 class AzureAdapter(BaseAdapter):
     """
     Adapter for Azure OpenAI API.
     """
 
+    provider_label = "azure"
+    supported_models = tuple(m["id"] for m in _MODELS["data"])
+
     def __init__(self, api_key: str, endpoint: str = None, **kwargs):
         super().__init__(api_key, **kwargs)
         self.endpoint = endpoint
@@ -18,13 +32,13 @@ class AzureAdapter(BaseAdapter):
         # TODO: Implement Azure OpenAI chat completion
         raise NotImplementedError("Azure chat completion not yet implemented")
 
-    async def chat_completion_stream(self, request: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    async def chat_completion_stream(self, request: Dict[str, Any]) -> AsyncIterator[bytes]:
         """
         Create a streaming chat completion using Azure OpenAI API.
         """
         # TODO: Implement Azure OpenAI streaming chat completion
         raise NotImplementedError("Azure streaming not yet implemented")
-        yield {}
+        yield b""
 
     async def create_embedding(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -33,14 +47,8 @@ class AzureAdapter(BaseAdapter):
         # TODO: Implement Azure OpenAI embeddings
         raise NotImplementedError("Azure embeddings not yet implemented")
 
-    def list_models(self) -> Dict[str, Any]:
+    def list_models(self) -> Mapping[str, Any]:
         """
         List available Azure OpenAI models.
         """
-        return {
-            "object": "list",
-            "data": [
-                {"id": "gpt-4", "object": "model", "owned_by": "azure-openai"},
-                {"id": "gpt-35-turbo", "object": "model", "owned_by": "azure-openai"},
-            ]
-        }
+        return _MODELS
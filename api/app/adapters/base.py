@@ -1,5 +1,9 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, AsyncIterator
+from typing import Any, AsyncIterator, Awaitable, Callable, ClassVar, Dict, Tuple
+
+from app.adapters.cache import ResponseCache, request_key
+from app.config import settings
 
 
 class BaseAdapter(ABC):
@@ -8,9 +12,101 @@ class BaseAdapter(ABC):
     All provider adapters must implement this interface.
     """
 
+    # Short provider name used for metric labels and log fields, fixed
+    # per class so the hot path never derives it from the class name.
+    provider_label: ClassVar[str] = ""
+
+    # Model ids this adapter serves, used to precompute the model ->
+    # adapter routing table at startup. Prefix dispatch remains the
+    # fallback for model ids released after this list was written.
+    supported_models: ClassVar[Tuple[str, ...]] = ()
+
     def __init__(self, api_key: str, **kwargs):
         self.api_key = api_key
         self.config = kwargs
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._response_cache = ResponseCache(
+            maxsize=settings.RESPONSE_CACHE_MAXSIZE,
+            ttl=settings.RESPONSE_CACHE_TTL,
+        )
+
+    async def _deterministic(
+        self,
+        kind: str,
+        request: Dict[str, Any],
+        call: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Serve a deterministic request through the response cache, falling
+        back to a coalesced provider call on miss.
+
+        Args:
+            kind: Namespace for the key (e.g. "chat", "embed")
+            request: Normalized request format
+            call: Zero-arg coroutine function issuing the real call
+
+        Returns:
+            Response in OpenAI-compatible format
+        """
+        key = request_key(kind, request)
+        cached = await self._response_cache.get(key)
+        if cached is not None:
+            return cached
+        result = await self._singleflight_keyed(key, call)
+        await self._response_cache.set(key, result)
+        return result
+
+    async def _singleflight_keyed(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Deduplicate identical concurrent requests.
+
+        If a request with the same canonical key is already in flight,
+        await its result instead of issuing a second provider call. Only
+        deterministic requests should be routed through here.
+
+        Args:
+            key: Canonical request key (see cache.request_key)
+            call: Zero-arg coroutine function issuing the real call
+
+        Returns:
+            Response in OpenAI-compatible format
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            # Shield the shared future so one cancelled follower does not
+            # tear down the request everyone else is waiting on.
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await call()
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved in case nobody joined
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            # Leader cancellation (client disconnect, wait_for timeout)
+            # raises CancelledError past the except clause above; cancel
+            # the shared future so shielded joiners are released instead
+            # of waiting on a future nobody will ever resolve.
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(key, None)
+
+    async def aclose(self) -> None:
+        """
+        Release any resources held by this adapter (e.g. SDK HTTP clients).
+        Adapters that own network clients should override this.
+        """
+        pass
 
     @abstractmethod
     async def chat_completion(self, request: Dict[str, Any]) -> Dict[str, Any]:
@@ -26,7 +122,7 @@ class BaseAdapter(ABC):
         pass
 
     @abstractmethod
-    async def chat_completion_stream(self, request: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    async def chat_completion_stream(self, request: Dict[str, Any]) -> AsyncIterator[bytes]:
         """
         Create a streaming chat completion.
 
@@ -34,7 +130,8 @@ class BaseAdapter(ABC):
             request: Normalized request format
 
         Yields:
-            Response chunks in OpenAI-compatible format
+            orjson-serialized chunks in OpenAI-compatible format, ready
+            for SSE framing
         """
         pass
 
@@ -52,11 +149,17 @@ class BaseAdapter(ABC):
         pass
 
     @abstractmethod
-    def list_models(self) -> Dict[str, Any]:
+    def list_models(self) -> Any:
         """
         List available models for this provider.
 
+        Static providers return their model dict directly — a plain call,
+        no coroutine allocation. Providers with a live listing endpoint
+        declare this async and return an awaitable instead; callers
+        should check the result with inspect.isawaitable.
+
         Returns:
-            List of models in OpenAI-compatible format
+            List of models in OpenAI-compatible format, or an awaitable
+            resolving to one
         """
         pass
@@ -0,0 +1,86 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+FlushFn = Callable[[str, List[Any]], Awaitable[List[Any]]]
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent single payloads into one batched provider call.
+
+    Payloads submitted under the same key within a short window are
+    grouped and flushed together; each caller awaits its own future and
+    receives only its slice of the batched result. Designed for the
+    embedding path, where one provider round-trip can carry dozens of
+    inputs at essentially the cost of one.
+
+    All bookkeeping happens on the event loop, so no locking is needed.
+    """
+
+    def __init__(self, flush: FlushFn, window_ms: int, max_batch: int):
+        """
+        Args:
+            flush: Coroutine called with (key, payloads) returning one
+                result per payload, in order
+            window_ms: How long to hold the first payload open for company
+            max_batch: Flush immediately once this many payloads are queued
+        """
+        self._flush = flush
+        self._window = window_ms / 1000.0
+        self._max_batch = max_batch
+        self._pending: Dict[str, List[Tuple[Any, asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.Task] = {}
+        # Strong refs to in-progress flush tasks so the loop cannot
+        # garbage-collect them mid-flight.
+        self._flushes: set = set()
+
+    async def submit(self, key: str, payload: Any) -> Any:
+        """
+        Queue a payload and wait for its result from the batched call.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        batch = self._pending.setdefault(key, [])
+        batch.append((payload, future))
+
+        if len(batch) >= self._max_batch:
+            timer = self._timers.pop(key, None)
+            if timer is not None:
+                timer.cancel()
+            # Flush in a dedicated task: if it ran inline in the Nth
+            # submitter and that request were cancelled mid-flush, every
+            # other member's future would never be resolved.
+            task = asyncio.create_task(self._flush_key(key))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+        elif len(batch) == 1:
+            self._timers[key] = asyncio.create_task(self._delayed_flush(key))
+
+        return await future
+
+    async def _delayed_flush(self, key: str) -> None:
+        await asyncio.sleep(self._window)
+        self._timers.pop(key, None)
+        await self._flush_key(key)
+
+    async def _flush_key(self, key: str) -> None:
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        payloads = [payload for payload, _ in batch]
+        try:
+            results = await self._flush(key, payloads)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            # Safety net for CancelledError, which skips the except
+            # clause: never leave a batch member waiting forever.
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
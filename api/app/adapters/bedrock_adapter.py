@@ -1,32 +1,132 @@
-from typing import Dict, Any, AsyncIterator
+import asyncio
+import time
+import uuid
+from types import MappingProxyType
+from typing import Dict, Any, AsyncIterator, Mapping
+
+import aioboto3
+import orjson
 from app.adapters.base import BaseAdapter
 
+# Anthropic-on-Bedrock message API version
+ANTHROPIC_BEDROCK_VERSION = "bedrock-2023-05-31"
+DEFAULT_MAX_TOKENS = 4096
+
+# Static model list, built once at import and frozen so list_models
+# hands every caller the same immutable payload.
+_MODELS = MappingProxyType({
+    "object": "list",
+    "data": (
+        MappingProxyType({"id": "anthropic.claude-v2", "object": "model", "owned_by": "aws-bedrock"}),
+        MappingProxyType({"id": "anthropic.claude-instant-v1", "object": "model", "owned_by": "aws-bedrock"}),
+    ),
+})
+
 
 class BedrockAdapter(BaseAdapter):
     """
     Adapter for AWS Bedrock API.
+
+    A single aioboto3 session and bedrock-runtime client are created up
+    front and reused across calls; per-call boto client construction is
+    notoriously expensive (hundreds of ms cold) and would defeat
+    keep-alive to the Bedrock endpoint.
     """
 
+    provider_label = "bedrock"
+    supported_models = tuple(m["id"] for m in _MODELS["data"])
+
     def __init__(self, aws_access_key_id: str = None, aws_secret_access_key: str = None, region: str = "us-east-1", **kwargs):
         super().__init__(api_key="", **kwargs)
         self.aws_access_key_id = aws_access_key_id
         self.aws_secret_access_key = aws_secret_access_key
         self.region = region
+        self._session = aioboto3.Session(
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            region_name=region,
+        )
+        self._client = None
+        self._client_ctx = None
+        self._client_lock = asyncio.Lock()
+
+    async def _get_client(self):
+        """
+        Lazily enter and cache the bedrock-runtime client context, so
+        every call after the first reuses the same pooled client.
+        """
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    self._client_ctx = self._session.client("bedrock-runtime")
+                    self._client = await self._client_ctx.__aenter__()
+        return self._client
 
     async def chat_completion(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a chat completion using AWS Bedrock API.
+
+        Supports Anthropic models (anthropic.*) through the Bedrock
+        messages API.
         """
-        # TODO: Implement Bedrock chat completion
-        raise NotImplementedError("Bedrock chat completion not yet implemented")
+        model = request["model"]
+        if not model.startswith("anthropic."):
+            raise NotImplementedError(f"Bedrock chat completion not implemented for {model}")
 
-    async def chat_completion_stream(self, request: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        client = await self._get_client()
+        system_prompt = next(
+            (m["content"] for m in request["messages"] if m["role"] == "system"), ""
+        )
+        body = {
+            "anthropic_version": ANTHROPIC_BEDROCK_VERSION,
+            "max_tokens": request.get("max_tokens") or DEFAULT_MAX_TOKENS,
+            "messages": [
+                {"role": m["role"], "content": m["content"]}
+                for m in request["messages"]
+                if m["role"] != "system"
+            ],
+        }
+        if system_prompt:
+            body["system"] = system_prompt
+        if request.get("temperature") is not None:
+            body["temperature"] = request["temperature"]
+
+        response = await client.invoke_model(modelId=model, body=orjson.dumps(body))
+        payload = orjson.loads(await response["body"].read())
+
+        created = int(time.time())
+        usage = payload.get("usage", {})
+        prompt_tokens = usage.get("input_tokens", 0)
+        completion_tokens = usage.get("output_tokens", 0)
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {
+                        "role": "assistant",
+                        "content": payload["content"][0]["text"],
+                    },
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    async def chat_completion_stream(self, request: Dict[str, Any]) -> AsyncIterator[bytes]:
         """
         Create a streaming chat completion using AWS Bedrock API.
         """
         # TODO: Implement Bedrock streaming chat completion
         raise NotImplementedError("Bedrock streaming not yet implemented")
-        yield {}
+        yield b""
 
     async def create_embedding(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -35,14 +135,14 @@ class BedrockAdapter(BaseAdapter):
         # TODO: Implement Bedrock embeddings
         raise NotImplementedError("Bedrock embeddings not yet implemented")
 
-    def list_models(self) -> Dict[str, Any]:
+    def list_models(self) -> Mapping[str, Any]:
         """
         List available Bedrock models.
         """
-        return {
-            "object": "list",
-            "data": [
-                {"id": "anthropic.claude-v2", "object": "model", "owned_by": "aws-bedrock"},
-                {"id": "anthropic.claude-instant-v1", "object": "model", "owned_by": "aws-bedrock"},
-            ]
-        }
+        return _MODELS
+
+    async def aclose(self) -> None:
+        if self._client_ctx is not None:
+            await self._client_ctx.__aexit__(None, None, None)
+            self._client = None
+            self._client_ctx = None
@@ -0,0 +1,45 @@
+import asyncio
+import hashlib
+from typing import Any, Dict, Optional
+
+import orjson
+from cachetools import TTLCache
+
+
+def request_key(kind: str, request: Dict[str, Any]) -> str:
+    """
+    Canonical cache key for a normalized request.
+
+    Args:
+        kind: Namespace for the key (e.g. "chat", "embed")
+        request: Normalized request format
+
+    Returns:
+        Stable key independent of dict insertion order
+    """
+    digest = hashlib.blake2b(
+        orjson.dumps(request, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
+    return f"{kind}:{digest}"
+
+
+class ResponseCache:
+    """
+    LRU + TTL cache for deterministic provider responses.
+
+    Repeated identical deterministic calls (temperature-0 chat,
+    embeddings) collapse to a dict lookup instead of a provider
+    round-trip.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 3600.0):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = asyncio.Lock()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        async with self._lock:
+            return self._cache.get(key)
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        async with self._lock:
+            self._cache[key] = value
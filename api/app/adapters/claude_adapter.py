@@ -1,5 +1,43 @@
-from typing import Dict, Any, AsyncIterator
+import time
+import uuid
+from types import MappingProxyType
+from typing import Dict, Any, AsyncIterator, List, Tuple, Mapping
+
+import orjson
+from anthropic import APIConnectionError, APIStatusError, AsyncAnthropic
 from app.adapters.base import BaseAdapter
+from app.adapters.http import get_shared_http_client
+from app.utils.errors import ProviderError
+
+DEFAULT_MAX_TOKENS = 4096
+
+# Static model list, built once at import and frozen so list_models
+# hands every caller the same immutable payload.
+_MODELS = MappingProxyType({
+    "object": "list",
+    "data": (
+        MappingProxyType({"id": "claude-3-opus-20240229", "object": "model", "owned_by": "anthropic"}),
+        MappingProxyType({"id": "claude-3-sonnet-20240229", "object": "model", "owned_by": "anthropic"}),
+        MappingProxyType({"id": "claude-3-haiku-20240307", "object": "model", "owned_by": "anthropic"}),
+    ),
+})
+
+
+def _provider_error(e: Exception) -> ProviderError:
+    """
+    Map an Anthropic SDK exception onto a ProviderError, preserving
+    status and retry-after information for upstream backoff logic.
+    """
+    if isinstance(e, APIStatusError):
+        retry_after = e.response.headers.get("retry-after")
+        return ProviderError(
+            "claude",
+            e.message,
+            kind="rate_limit" if e.status_code == 429 else "api_error",
+            status=e.status_code,
+            retry_after=float(retry_after) if retry_after else None,
+        )
+    return ProviderError("claude", str(e), kind="connection_error")
 
 
 class ClaudeAdapter(BaseAdapter):
@@ -7,20 +45,153 @@ class ClaudeAdapter(BaseAdapter):
     Adapter for Anthropic Claude API.
     """
 
+    provider_label = "claude"
+    supported_models = tuple(m["id"] for m in _MODELS["data"])
+
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
+        self.client = AsyncAnthropic(
+            api_key=api_key,
+            http_client=get_shared_http_client(),
+        )
+
+    def _convert_messages_to_claude(
+        self, messages: List[Dict[str, Any]]
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Split OpenAI-style messages into a Claude system prompt and
+        message list.
+        """
+        system_prompt = next(
+            (m["content"] for m in messages if m["role"] == "system"), ""
+        )
+        claude_messages = [
+            {"role": m["role"], "content": m["content"]}
+            for m in messages
+            if m["role"] != "system"
+        ]
+        return system_prompt, claude_messages
+
+    def _build_claude_params(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the Claude messages.create kwargs from a normalized request.
+        """
+        system_prompt, claude_messages = self._convert_messages_to_claude(request["messages"])
+        params = {
+            "model": request["model"],
+            "messages": claude_messages,
+            "max_tokens": request.get("max_tokens") or DEFAULT_MAX_TOKENS,
+        }
+        if system_prompt:
+            params["system"] = system_prompt
+        if request.get("temperature") is not None:
+            params["temperature"] = request["temperature"]
+        if request.get("top_p") is not None:
+            params["top_p"] = request["top_p"]
+        if request.get("stop"):
+            stop = request["stop"]
+            params["stop_sequences"] = [stop] if isinstance(stop, str) else stop
+        return params
+
+    def _convert_claude_to_openai(self, response: Any, model: str) -> Dict[str, Any]:
+        """
+        Convert a Claude response into OpenAI chat completion format.
+        """
+        created = int(time.time())
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {
+                        "role": "assistant",
+                        "content": response.content[0].text,
+                    },
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": response.usage.input_tokens,
+                "completion_tokens": response.usage.output_tokens,
+                "total_tokens": response.usage.input_tokens + response.usage.output_tokens,
+            },
+        }
+
+    async def _chat_call(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        params = self._build_claude_params(request)
+        response = await self.client.messages.create(**params)
+        return self._convert_claude_to_openai(response, request["model"])
+
     async def chat_completion(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a chat completion using Claude API.
+
+        Deterministic (temperature 0) requests are served from the response
+        cache when possible and coalesced otherwise.
         """
-        # TODO: Implement Claude chat completion
-        raise NotImplementedError("Claude chat completion not yet implemented")
+        try:
+            if request.get("temperature", 1.0) == 0:
+                return await self._deterministic(
+                    "chat", request, lambda: self._chat_call(request)
+                )
+            return await self._chat_call(request)
+        except (APIStatusError, APIConnectionError) as e:
+            raise _provider_error(e) from e
 
-    async def chat_completion_stream(self, request: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    async def chat_completion_stream(self, request: Dict[str, Any]) -> AsyncIterator[bytes]:
         """
         Create a streaming chat completion using Claude API.
+
+        Chunks are yielded as orjson-serialized bytes so the SSE route
+        only has to prepend the event framing.
         """
-        # TODO: Implement Claude streaming chat completion
-        raise NotImplementedError("Claude streaming not yet implemented")
-        yield {}
+        try:
+            params = self._build_claude_params(request)
+            # All chunk fields except the delta text are invariant for the
+            # whole response; build the envelope once and mutate only the
+            # content between yields (each chunk is serialized before the
+            # next iteration).
+            created = int(time.time())
+            # One unique id shared by every chunk of this response —
+            # matches OpenAI semantics, unlike a second-resolution
+            # timestamp that collides across concurrent streams.
+            chunk_id = f"chatcmpl-{uuid.uuid4().hex}"
+            delta = {"content": ""}
+            template = {
+                "id": chunk_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": request["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": delta,
+                        "finish_reason": None,
+                    }
+                ],
+            }
+            async with self.client.messages.stream(**params) as stream:
+                async for text in stream.text_stream:
+                    delta["content"] = text
+                    yield orjson.dumps(template)
+                yield orjson.dumps({
+                    "id": chunk_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": request["model"],
+                    "choices": [
+                        {
+                            "index": 0,
+                            "delta": {},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                })
+        except (APIStatusError, APIConnectionError) as e:
+            raise _provider_error(e) from e
 
     async def create_embedding(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -28,15 +199,11 @@ class ClaudeAdapter(BaseAdapter):
         """
         raise NotImplementedError("Claude does not support embeddings")
 
-    def list_models(self) -> Dict[str, Any]:
+    def list_models(self) -> Mapping[str, Any]:
         """
         List available Claude models.
         """
-        return {
-            "object": "list",
-            "data": [
-                {"id": "claude-3-opus-20240229", "object": "model", "owned_by": "anthropic"},
-                {"id": "claude-3-sonnet-20240229", "object": "model", "owned_by": "anthropic"},
-                {"id": "claude-3-haiku-20240307", "object": "model", "owned_by": "anthropic"},
-            ]
-        }
+        return _MODELS
+
+    async def aclose(self) -> None:
+        await self.client.close()
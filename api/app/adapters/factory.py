@@ -1,51 +1,162 @@
-from typing import Optional
+import threading
+from typing import Dict, Optional
 from app.adapters.base import BaseAdapter
-from app.adapters.openai_adapter import OpenAIAdapter
-from app.adapters.claude_adapter import ClaudeAdapter
-from app.adapters.azure_adapter import AzureAdapter
-from app.adapters.bedrock_adapter import BedrockAdapter
-from app.adapters.gemini_adapter import GeminiAdapter
-from app.adapters.grok_adapter import GrokAdapter
 from app.config import settings
 
+# First hyphen-separated segment of a model name -> provider, so model
+# routing is one dict hit instead of a startswith chain per request.
+_PREFIX_TO_PROVIDER = {
+    "gpt": "openai",
+    "o1": "openai",
+    "text": "openai",  # text-embedding-*
+    "claude": "claude",
+    "gemini": "gemini",
+    "grok": "grok",
+}
+
+# Routing-table precedence for model ids claimed by more than one
+# provider (Azure also lists "gpt-4"). Providers with implemented
+# adapters come first; the stubs can only claim ids nobody real wants.
+# First claim wins, so the order here is the whole tie-break.
+_MODEL_TABLE_PRIORITY = ("openai", "claude", "bedrock", "azure", "gemini", "grok")
+
+# Settings attributes that must all be present for a provider to count
+# as configured.
+_PROVIDER_CONFIG_KEYS = {
+    "openai": ("OPENAI_API_KEY",),
+    "claude": ("ANTHROPIC_API_KEY",),
+    "azure": ("AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT"),
+    "bedrock": ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"),
+    "gemini": ("GEMINI_API_KEY",),
+    "grok": ("GROK_API_KEY",),
+}
+
+
+def configured_providers() -> list:
+    """
+    Providers whose credentials are present in settings.
+    """
+    return [
+        provider
+        for provider, keys in _PROVIDER_CONFIG_KEYS.items()
+        if all(getattr(settings, key, None) for key in keys)
+    ]
+
 
 class AdapterFactory:
     """
     Factory class for creating provider adapters.
+
+    Adapter instances are cached per provider so every request reuses the
+    same adapter (and therefore the same underlying HTTP connection pool)
+    instead of paying client construction and TLS handshake costs per call.
+
+    Adapter modules are imported on first use, so a deployment configured
+    for one provider never pays import time or memory for the others'
+    SDKs.
     """
 
+    _cache: Dict[str, BaseAdapter] = {}
+    _lock = threading.Lock()
+    # model id -> adapter instance, built once at startup so the
+    # per-request route is a single dict hit.
+    _model_table: Dict[str, BaseAdapter] = {}
+
     @staticmethod
-    def get_adapter(provider: str) -> Optional[BaseAdapter]:
+    def _create_adapter(provider: str) -> Optional[BaseAdapter]:
         """
-        Get the appropriate adapter for the given provider.
-
-        Args:
-            provider: Provider name (openai, claude, azure, bedrock, gemini, grok)
-
-        Returns:
-            Initialized adapter instance
+        Construct the adapter for a provider, importing its module (and
+        transitively the provider SDK) only here.
         """
-        adapters = {
-            "openai": lambda: OpenAIAdapter(api_key=settings.OPENAI_API_KEY),
-            "claude": lambda: ClaudeAdapter(api_key=settings.ANTHROPIC_API_KEY),
-            "azure": lambda: AzureAdapter(
+        if provider == "openai":
+            from app.adapters.openai_adapter import OpenAIAdapter
+            return OpenAIAdapter(api_key=settings.OPENAI_API_KEY)
+        if provider == "claude":
+            from app.adapters.claude_adapter import ClaudeAdapter
+            return ClaudeAdapter(api_key=settings.ANTHROPIC_API_KEY)
+        if provider == "azure":
+            from app.adapters.azure_adapter import AzureAdapter
+            return AzureAdapter(
                 api_key=settings.AZURE_OPENAI_API_KEY,
                 endpoint=settings.AZURE_OPENAI_ENDPOINT
-            ),
-            "bedrock": lambda: BedrockAdapter(
+            )
+        if provider == "bedrock":
+            from app.adapters.bedrock_adapter import BedrockAdapter
+            return BedrockAdapter(
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
                 region=settings.AWS_REGION
-            ),
-            "gemini": lambda: GeminiAdapter(api_key=settings.GEMINI_API_KEY),
-            "grok": lambda: GrokAdapter(api_key=settings.GROK_API_KEY),
-        }
-
-        adapter_creator = adapters.get(provider.lower())
-        if adapter_creator:
-            return adapter_creator()
+            )
+        if provider == "gemini":
+            from app.adapters.gemini_adapter import GeminiAdapter
+            return GeminiAdapter(api_key=settings.GEMINI_API_KEY)
+        if provider == "grok":
+            from app.adapters.grok_adapter import GrokAdapter
+            return GrokAdapter(api_key=settings.GROK_API_KEY)
         return None
 
+    @classmethod
+    def get_adapter(cls, provider: str) -> Optional[BaseAdapter]:
+        """
+        Get the appropriate adapter for the given provider.
+
+        Args:
+            provider: Provider name (openai, claude, azure, bedrock, gemini, grok)
+
+        Returns:
+            Cached adapter instance, created on first use
+        """
+        provider_lower = provider.lower()
+
+        adapter = cls._cache.get(provider_lower)
+        if adapter is not None:
+            return adapter
+
+        with cls._lock:
+            # Re-check under the lock so concurrent first requests do not
+            # each construct their own adapter.
+            adapter = cls._cache.get(provider_lower)
+            if adapter is None:
+                adapter = cls._create_adapter(provider_lower)
+                if adapter is not None:
+                    cls._cache[provider_lower] = adapter
+        return adapter
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """
+        Close all cached adapters and drop the cache.
+
+        Wired into application shutdown so pooled HTTP connections are
+        released cleanly.
+        """
+        with cls._lock:
+            adapters = list(cls._cache.values())
+            cls._cache.clear()
+        for adapter in adapters:
+            await adapter.aclose()
+
+    @classmethod
+    def build_model_table(cls) -> None:
+        """
+        Populate the model routing table from each configured adapter's
+        supported_models. Called at startup; safe to call again after a
+        configuration change.
+        """
+        table: Dict[str, BaseAdapter] = {}
+        configured = set(configured_providers())
+        for provider in _MODEL_TABLE_PRIORITY:
+            if provider not in configured:
+                continue
+            adapter = cls.get_adapter(provider)
+            if adapter is None:
+                continue
+            for model_id in adapter.supported_models:
+                # setdefault: an id already claimed by a higher-priority
+                # provider is never rerouted to a later one.
+                table.setdefault(model_id, adapter)
+        cls._model_table = table
+
     @staticmethod
     def get_adapter_for_model(model: str) -> Optional[BaseAdapter]:
         """
@@ -55,17 +166,19 @@ class AdapterFactory:
             model: Model name (e.g., gpt-4, claude-3-opus, gemini-pro)
 
         Returns:
-            Initialized adapter instance
+            Cached adapter instance
         """
-        model_lower = model.lower()
-
-        if model_lower.startswith("gpt-"):
-            return AdapterFactory.get_adapter("openai")
-        elif model_lower.startswith("claude-"):
-            return AdapterFactory.get_adapter("claude")
-        elif model_lower.startswith("gemini-"):
-            return AdapterFactory.get_adapter("gemini")
-        elif model_lower.startswith("grok-"):
-            return AdapterFactory.get_adapter("grok")
-        else:
+        adapter = AdapterFactory._model_table.get(model)
+        if adapter is not None:
+            return adapter
+        # Unknown id (e.g. a model released after supported_models was
+        # written): fall back to prefix dispatch. Model names are
+        # lowercase in practice, so try the raw head first — .lower()
+        # only runs on a miss.
+        head = model.partition("-")[0]
+        provider = _PREFIX_TO_PROVIDER.get(head)
+        if provider is None:
+            provider = _PREFIX_TO_PROVIDER.get(head.lower())
+        if provider is None:
             return None
+        return AdapterFactory.get_adapter(provider)
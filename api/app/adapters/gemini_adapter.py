@@ -1,12 +1,26 @@
-from typing import Dict, Any, AsyncIterator
+from types import MappingProxyType
+from typing import Dict, Any, AsyncIterator, Mapping
 from app.adapters.base import BaseAdapter
 
+# Static model list, built once at import and frozen so list_models
+# hands every caller the same immutable payload.
+_MODELS = MappingProxyType({
+    "object": "list",
+    "data": (
+        MappingProxyType({"id": "gemini-pro", "object": "model", "owned_by": "google"}),
+        MappingProxyType({"id": "gemini-pro-vision", "object": "model", "owned_by": "google"}),
+    ),
+})
+
 
 class GeminiAdapter(BaseAdapter):
     """
     Adapter for Google Gemini API.
     """
 
+    provider_label = "gemini"
+    supported_models = tuple(m["id"] for m in _MODELS["data"])
+
     async def chat_completion(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a chat completion using Gemini API.
@@ -14,13 +28,13 @@ class GeminiAdapter(BaseAdapter):
         # TODO: Implement Gemini chat completion
         raise NotImplementedError("Gemini chat completion not yet implemented")
 
-    async def chat_completion_stream(self, request: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    async def chat_completion_stream(self, request: Dict[str, Any]) -> AsyncIterator[bytes]:
         """
         Create a streaming chat completion using Gemini API.
         """
         # TODO: Implement Gemini streaming chat completion
         raise NotImplementedError("Gemini streaming not yet implemented")
-        yield {}
+        yield b""
 
     async def create_embedding(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -29,14 +43,8 @@ class GeminiAdapter(BaseAdapter):
         # TODO: Implement Gemini embeddings
         raise NotImplementedError("Gemini embeddings not yet implemented")
 
-    def list_models(self) -> Dict[str, Any]:
+    def list_models(self) -> Mapping[str, Any]:
         """
         List available Gemini models.
         """
-        return {
-            "object": "list",
-            "data": [
-                {"id": "gemini-pro", "object": "model", "owned_by": "google"},
-                {"id": "gemini-pro-vision", "object": "model", "owned_by": "google"},
-            ]
-        }
+        return _MODELS
@@ -1,12 +1,25 @@
-from typing import Dict, Any, AsyncIterator
+from types import MappingProxyType
+from typing import Dict, Any, AsyncIterator, Mapping
 from app.adapters.base import BaseAdapter
 
+# Static model list, built once at import and frozen so list_models
+# hands every caller the same immutable payload.
+_MODELS = MappingProxyType({
+    "object": "list",
+    "data": (
+        MappingProxyType({"id": "grok-1", "object": "model", "owned_by": "xai"}),
+    ),
+})
+
 
 class GrokAdapter(BaseAdapter):
     """
     Adapter for xAI Grok API.
     """
 
+    provider_label = "grok"
+    supported_models = tuple(m["id"] for m in _MODELS["data"])
+
     async def chat_completion(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a chat completion using Grok API.
@@ -14,13 +27,13 @@ class GrokAdapter(BaseAdapter):
         # TODO: Implement Grok chat completion
         raise NotImplementedError("Grok chat completion not yet implemented")
 
-    async def chat_completion_stream(self, request: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    async def chat_completion_stream(self, request: Dict[str, Any]) -> AsyncIterator[bytes]:
         """
         Create a streaming chat completion using Grok API.
         """
         # TODO: Implement Grok streaming chat completion
         raise NotImplementedError("Grok streaming not yet implemented")
-        yield {}
+        yield b""
 
     async def create_embedding(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -29,13 +42,8 @@ class GrokAdapter(BaseAdapter):
         # TODO: Implement Grok embeddings
         raise NotImplementedError("Grok embeddings not yet implemented")
 
-    def list_models(self) -> Dict[str, Any]:
+    def list_models(self) -> Mapping[str, Any]:
         """
         List available Grok models.
         """
-        return {
-            "object": "list",
-            "data": [
-                {"id": "grok-1", "object": "model", "owned_by": "xai"},
-            ]
-        }
+        return _MODELS
@@ -0,0 +1,40 @@
+from typing import Optional
+import httpx
+from app.config import settings
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide httpx.AsyncClient shared by all provider SDKs.
+
+    Sharing one client means every adapter draws from the same connection
+    pool, with limits tuned for high-concurrency workloads instead of the
+    httpx defaults (100 connections, short keepalive).
+
+    Returns:
+        The shared httpx.AsyncClient, created on first use
+    """
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=settings.HTTP2_ENABLED,
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(connect=5.0, read=120.0, write=30.0, pool=5.0),
+        )
+    return _client
+
+
+async def aclose_shared_http_client() -> None:
+    """
+    Close the shared client on application shutdown.
+    """
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
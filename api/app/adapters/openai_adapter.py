@@ -1,5 +1,34 @@
-from typing import Dict, Any, AsyncIterator
+import time
+from typing import Dict, Any, AsyncIterator, Optional, Tuple
+
+import orjson
+from openai import APIConnectionError, APIStatusError, AsyncOpenAI
 from app.adapters.base import BaseAdapter
+from app.adapters.batcher import MicroBatcher
+from app.adapters.http import get_shared_http_client
+from app.config import settings
+from app.utils.errors import ProviderError
+
+# The model catalog changes rarely; refresh at most once a day and serve
+# the stale copy if a refresh fails.
+MODELS_TTL_SECONDS = 86400
+
+
+def _provider_error(e: Exception) -> ProviderError:
+    """
+    Map an OpenAI SDK exception onto a ProviderError, preserving status
+    and retry-after information for upstream backoff logic.
+    """
+    if isinstance(e, APIStatusError):
+        retry_after = e.response.headers.get("retry-after")
+        return ProviderError(
+            "openai",
+            e.message,
+            kind="rate_limit" if e.status_code == 429 else "api_error",
+            status=e.status_code,
+            retry_after=float(retry_after) if retry_after else None,
+        )
+    return ProviderError("openai", str(e), kind="connection_error")
 
 
 class OpenAIAdapter(BaseAdapter):
@@ -7,37 +36,157 @@ class OpenAIAdapter(BaseAdapter):
     Adapter for OpenAI API.
     """
 
+    provider_label = "openai"
+    # OpenAI's catalogue is dynamic; these are the ids we route most,
+    # anything newer falls through to prefix dispatch.
+    supported_models = (
+        "gpt-4",
+        "gpt-4-turbo",
+        "gpt-4o",
+        "gpt-4o-mini",
+        "gpt-3.5-turbo",
+        "o1-preview",
+        "o1-mini",
+        "text-embedding-ada-002",
+        "text-embedding-3-small",
+        "text-embedding-3-large",
+    )
+
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=get_shared_http_client(),
+        )
+        self._models_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._embedding_batcher = MicroBatcher(
+            self._embed_batch,
+            window_ms=settings.EMBED_BATCH_WINDOW_MS,
+            max_batch=settings.EMBED_BATCH_MAX,
+        )
+
+    async def _chat_call(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        response = await self.client.chat.completions.create(**request)
+        return response.model_dump(mode="python", exclude_none=True)
+
     async def chat_completion(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a chat completion using OpenAI API.
+
+        Deterministic (temperature 0) requests are served from the response
+        cache when possible and coalesced otherwise.
         """
-        # TODO: Implement OpenAI chat completion
-        raise NotImplementedError("OpenAI chat completion not yet implemented")
+        try:
+            if request.get("temperature", 1.0) == 0:
+                return await self._deterministic(
+                    "chat", request, lambda: self._chat_call(request)
+                )
+            return await self._chat_call(request)
+        except (APIStatusError, APIConnectionError) as e:
+            raise _provider_error(e) from e
 
-    async def chat_completion_stream(self, request: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    async def chat_completion_stream(self, request: Dict[str, Any]) -> AsyncIterator[bytes]:
         """
         Create a streaming chat completion using OpenAI API.
+
+        The request dict is set to stream mode in place; callers hand the
+        adapter a freshly built dict, so no defensive copy is needed.
+        Chunks are yielded as orjson-serialized bytes so the SSE route
+        only has to prepend the event framing.
         """
-        # TODO: Implement OpenAI streaming chat completion
-        raise NotImplementedError("OpenAI streaming not yet implemented")
-        yield {}
+        try:
+            request["stream"] = True
+            stream = await self.client.chat.completions.create(**request)
+            async for chunk in stream:
+                yield orjson.dumps(chunk.model_dump(mode="python", exclude_none=True))
+        except (APIStatusError, APIConnectionError) as e:
+            raise _provider_error(e) from e
+
+    def _batchable_embedding(self, request: Dict[str, Any]) -> bool:
+        """
+        Single string input with default options — the common case that
+        can safely ride in a shared batch.
+        """
+        return (
+            isinstance(request.get("input"), str)
+            and request.get("encoding_format", "float") == "float"
+            and "user" not in request
+            and "dimensions" not in request
+        )
+
+    async def _embed_batch(self, model: str, inputs: list) -> list:
+        """
+        Flush callback for the embedding micro-batcher: one provider call
+        for the whole batch, split back into per-caller responses.
+
+        Token usage is not reported per input by the API, so each caller
+        gets an even share of the batch usage.
+        """
+        response = await self.client.embeddings.create(model=model, input=inputs)
+        share = response.usage.prompt_tokens // len(inputs)
+        return [
+            {
+                "object": "list",
+                "data": [
+                    {"object": "embedding", "embedding": item.embedding, "index": 0}
+                ],
+                "model": response.model,
+                "usage": {
+                    "prompt_tokens": share,
+                    "completion_tokens": 0,
+                    "total_tokens": share,
+                },
+            }
+            for item in response.data
+        ]
+
+    async def _embed_call(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        response = await self.client.embeddings.create(**request)
+        return response.model_dump(mode="python", exclude_none=True)
 
     async def create_embedding(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create embeddings using OpenAI API.
+
+        Concurrent single-input requests for the same model are coalesced
+        into one batched provider call.
         """
-        # TODO: Implement OpenAI embeddings
-        raise NotImplementedError("OpenAI embeddings not yet implemented")
+        try:
+            if self._batchable_embedding(request):
+                return await self._embedding_batcher.submit(
+                    request["model"], request["input"]
+                )
+            # Embeddings are deterministic, so identical concurrent
+            # requests can always share one call.
+            return await self._deterministic(
+                "embed", request, lambda: self._embed_call(request)
+            )
+        except (APIStatusError, APIConnectionError) as e:
+            raise _provider_error(e) from e
 
-    def list_models(self) -> Dict[str, Any]:
+    async def list_models(self) -> Dict[str, Any]:
         """
-        List available OpenAI models.
+        List available OpenAI models from the API.
+
+        The response is cached for MODELS_TTL_SECONDS; on refresh failure
+        the stale copy is returned rather than erroring.
         """
-        return {
-            "object": "list",
-            "data": [
-                {"id": "gpt-4", "object": "model", "owned_by": "openai"},
-                {"id": "gpt-4-turbo", "object": "model", "owned_by": "openai"},
-                {"id": "gpt-3.5-turbo", "object": "model", "owned_by": "openai"},
-            ]
-        }
+        cached = self._models_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < MODELS_TTL_SECONDS:
+            return cached[1]
+        try:
+            response = await self.client.models.list()
+            payload = {
+                "object": "list",
+                "data": [model.model_dump(mode="python", exclude_none=True) for model in response.data],
+            }
+        except (APIStatusError, APIConnectionError) as e:
+            if cached is not None:
+                return cached[1]
+            raise _provider_error(e) from e
+        self._models_cache = (now, payload)
+        return payload
+
+    async def aclose(self) -> None:
+        await self.client.close()
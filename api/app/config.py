@@ -12,6 +12,28 @@ class Settings(BaseSettings):
     # CORS
     ALLOWED_ORIGINS: str = "*"
 
+    # Client API keys (comma-separated) accepted in production, plus
+    # how often the digest set is rebuilt from configuration
+    API_KEYS: str = ""
+    API_KEY_REFRESH_SECONDS: int = 300
+
+    # Outbound HTTP connection pool (shared by all provider SDK clients)
+    HTTP_MAX_CONNECTIONS: int = 500
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 100
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    # HTTP/2 multiplexes concurrent requests over few connections;
+    # kept as a switch for fast rollback if a provider misbehaves.
+    HTTP2_ENABLED: bool = True
+
+    # Embedding micro-batching: hold single-input requests briefly so
+    # concurrent callers share one provider round-trip
+    EMBED_BATCH_WINDOW_MS: int = 10
+    EMBED_BATCH_MAX: int = 64
+
+    # Response cache for deterministic (temperature 0) calls
+    RESPONSE_CACHE_MAXSIZE: int = 4096
+    RESPONSE_CACHE_TTL: float = 3600.0
+
     # Provider API Keys
     OPENAI_API_KEY: Optional[str] = None
     ANTHROPIC_API_KEY: Optional[str] = None
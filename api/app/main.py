@@ -1,15 +1,48 @@
+import asyncio
+
+import uvloop
 from fastapi import FastAPI
+
+# The service is entirely network-bound; uvloop's event loop is
+# substantially faster than stock asyncio for socket-heavy workloads.
+uvloop.install()
+from fastapi import Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from app.adapters.factory import AdapterFactory
+from app.adapters.http import aclose_shared_http_client, get_shared_http_client
 from app.config import settings
+from app.middleware.auth import load_key_hashes, start_key_refresher
+from app.middleware.metrics import flush_pending, start_metrics_flusher
+from app.middleware.unified import UnifiedMiddleware
 from app.routers import chat, embeddings, models
+from app.utils.logger import shutdown_logging
+
+# Provider hosts to pre-warm TLS connections against at startup, keyed by
+# the settings attribute that indicates the provider is configured.
+PREWARM_HOSTS = {
+    "OPENAI_API_KEY": "https://api.openai.com",
+    "ANTHROPIC_API_KEY": "https://api.anthropic.com",
+    "GEMINI_API_KEY": "https://generativelanguage.googleapis.com",
+    "GROK_API_KEY": "https://api.x.ai",
+}
 
 app = FastAPI(
     title="ChoreoAI",
     description="A unified API orchestration platform for multiple AI providers",
-    version="1.0.0"
+    version="1.0.0",
+    # Serialize every JSON response through orjson rather than stdlib json.
+    default_response_class=ORJSONResponse,
 )
 
-# Configure CORS
+# One pure ASGI middleware covering auth, logging and metrics.
+app.add_middleware(UnifiedMiddleware)
+
+# Configure CORS. Added last so it wraps UnifiedMiddleware (Starlette
+# runs the most recently added middleware outermost): preflight OPTIONS
+# requests carry no Authorization header and must be answered by CORS,
+# not rejected by auth.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS.split(","),
@@ -24,11 +57,62 @@ app.include_router(embeddings.router, prefix="/v1", tags=["embeddings"])
 app.include_router(models.router, prefix="/v1", tags=["models"])
 
 
+@app.on_event("startup")
+async def prewarm():
+    """
+    Open connections to configured provider endpoints before traffic
+    arrives, so the first real request does not pay the TCP+TLS handshake
+    on top of model latency.
+    """
+    client = get_shared_http_client()
+    requests = [
+        client.head(host)
+        for key, host in PREWARM_HOSTS.items()
+        if getattr(settings, key, None)
+    ]
+    if requests:
+        await asyncio.gather(*requests, return_exceptions=True)
+
+
+@app.on_event("startup")
+async def start_metrics():
+    app.state.metrics_flusher = start_metrics_flusher()
+
+
+@app.on_event("startup")
+async def build_routing_table():
+    AdapterFactory.build_model_table()
+
+
+@app.on_event("startup")
+async def load_api_keys():
+    load_key_hashes()
+    app.state.key_refresher = start_key_refresher()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    app.state.key_refresher.cancel()
+    app.state.metrics_flusher.cancel()
+    flush_pending()
+    await AdapterFactory.aclose()
+    await aclose_shared_http_client()
+    shutdown_logging()
+
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics")
+def metrics():
+    # Drain queued updates first so a scrape never misses the last
+    # flush window's worth of requests.
+    flush_pending()
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/")
 async def root():
     return {
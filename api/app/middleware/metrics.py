@@ -0,0 +1,113 @@
+import asyncio
+import threading
+from typing import Dict, List, Tuple
+
+from prometheus_client import Counter, Histogram
+
+# How often the background task applies pending metric updates. Far
+# below any realistic Prometheus scrape interval, so deferral has no
+# observability cost.
+FLUSH_INTERVAL_SECONDS = 0.1
+
+request_counter = Counter(
+    "choreoai_requests_total",
+    "Total HTTP requests",
+    ["method", "endpoint", "status", "provider", "model"],
+)
+request_duration = Histogram(
+    "choreoai_request_duration_seconds",
+    "HTTP request latency",
+    ["method", "endpoint", "provider"],
+)
+
+# Bound label children, keyed by label tuple. prometheus_client's
+# .labels() does its own lookup plus validation on every call; caching
+# the child makes the hot path a dict hit followed by .inc()/.observe().
+# These caches mirror the client's internal child maps, so they cannot
+# grow beyond the metric cardinality itself.
+_counter_children: Dict[Tuple[str, str, str, str, str], Counter] = {}
+_duration_children: Dict[Tuple[str, str, str], Histogram] = {}
+
+
+def get_request_counter(
+    method: str, endpoint: str, status: str, provider: str, model: str
+) -> Counter:
+    key = (method, endpoint, status, provider, model)
+    child = _counter_children.get(key)
+    if child is None:
+        child = request_counter.labels(
+            method=method,
+            endpoint=endpoint,
+            status=status,
+            provider=provider,
+            model=model,
+        )
+        _counter_children[key] = child
+    return child
+
+
+def get_request_duration(method: str, endpoint: str, provider: str) -> Histogram:
+    key = (method, endpoint, provider)
+    child = _duration_children.get(key)
+    if child is None:
+        child = request_duration.labels(
+            method=method,
+            endpoint=endpoint,
+            provider=provider,
+        )
+        _duration_children[key] = child
+    return child
+
+
+# Pending updates, applied in bulk by the background flusher so the
+# request path is two dict writes instead of prometheus_client's
+# hash-map updates. The lock is uncontended within one event loop.
+_pending_counts: Dict[Tuple[str, str, str, str, str], int] = {}
+_pending_durations: Dict[Tuple[str, str, str], List[float]] = {}
+_pending_lock = threading.Lock()
+
+
+def record_request(
+    method: str,
+    endpoint: str,
+    status: str,
+    provider: str,
+    model: str,
+    duration: float,
+) -> None:
+    """
+    Queue one request's metric updates for the next flush.
+    """
+    with _pending_lock:
+        ckey = (method, endpoint, status, provider, model)
+        _pending_counts[ckey] = _pending_counts.get(ckey, 0) + 1
+        _pending_durations.setdefault((method, endpoint, provider), []).append(duration)
+
+
+def flush_pending() -> None:
+    """
+    Apply all queued metric updates to the Prometheus registry.
+    """
+    global _pending_counts, _pending_durations
+    with _pending_lock:
+        counts, _pending_counts = _pending_counts, {}
+        durations, _pending_durations = _pending_durations, {}
+    for key, n in counts.items():
+        get_request_counter(*key).inc(n)
+    for key, values in durations.items():
+        child = get_request_duration(*key)
+        for value in values:
+            child.observe(value)
+
+
+async def _flush_loop() -> None:
+    while True:
+        await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+        flush_pending()
+
+
+def start_metrics_flusher() -> asyncio.Task:
+    """
+    Start the background flush task; call from application startup.
+    """
+    return asyncio.create_task(_flush_loop())
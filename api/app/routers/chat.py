@@ -1,21 +1,64 @@
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from app.adapters.factory import AdapterFactory
 from app.schemas.requests import ChatCompletionRequest
 from app.schemas.responses import ChatCompletionResponse
 
 router = APIRouter()
 
+# SSE framing, pre-encoded once; adapters yield chunk payloads as bytes
+# so the stream path never touches a Python string.
+SSE_PREFIX = b"data: "
+SSE_SUFFIX = b"\n\n"
+SSE_DONE = b"data: [DONE]\n\n"
+# Error frame with only the message spliced in; orjson.dumps of the
+# message supplies the quotes and JSON escaping.
+SSE_ERROR_TEMPLATE = b'data: {"error":{"message":__MSG__}}\n\n'
+
 
 @router.post("/chat/completions", response_model=ChatCompletionResponse)
-async def create_chat_completion(request: ChatCompletionRequest):
+async def create_chat_completion(request: ChatCompletionRequest, http_request: Request):
     """
     Create a chat completion using the unified API.
     Supports multiple AI providers through adapter pattern.
     """
-    try:
-        # TODO: Implement adapter selection and request routing
+    adapter = AdapterFactory.get_adapter_for_model(request.model)
+    if adapter is None:
         raise HTTPException(
-            status_code=501,
-            detail="Chat completion endpoint not yet implemented"
+            status_code=400,
+            detail=f"Unsupported model: {request.model}"
         )
+
+    # Routing metadata for the metrics/logging middleware
+    ctx = http_request.state.ctx
+    ctx.provider = adapter.provider_label
+    ctx.model = request.model
+    ctx.is_streaming = bool(request.stream)
+
+    # One dump per request is unavoidable — the provider SDKs and the
+    # response cache both consume plain dicts — but exclude_unset keeps
+    # it to the fields the client actually sent, so defaulted fields
+    # are neither walked into the dict nor forwarded upstream.
+    payload = request.model_dump(exclude_unset=True, exclude_none=True)
+
+    if request.stream:
+        async def stream_generator():
+            try:
+                async for chunk in adapter.chat_completion_stream(payload):
+                    yield SSE_PREFIX + chunk + SSE_SUFFIX
+                yield SSE_DONE
+            except Exception as e:
+                yield SSE_ERROR_TEMPLATE.replace(b"__MSG__", orjson.dumps(str(e)))
+
+        return StreamingResponse(stream_generator(), media_type="text/event-stream")
+
+    try:
+        # Adapters already emit OpenAI-format dicts; returning a Response
+        # directly skips FastAPI's response-model re-validation walk while
+        # response_model keeps documenting the shape.
+        return ORJSONResponse(await adapter.chat_completion(payload))
+    except NotImplementedError as e:
+        raise HTTPException(status_code=501, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
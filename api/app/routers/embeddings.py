@@ -1,4 +1,6 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from app.adapters.factory import AdapterFactory
 from app.schemas.requests import EmbeddingRequest
 from app.schemas.responses import EmbeddingResponse
 
@@ -6,16 +8,30 @@ router = APIRouter()
 
 
 @router.post("/embeddings", response_model=EmbeddingResponse)
-async def create_embedding(request: EmbeddingRequest):
+async def create_embedding(request: EmbeddingRequest, http_request: Request):
     """
     Create embeddings using the unified API.
     Supports multiple AI providers through adapter pattern.
     """
-    try:
-        # TODO: Implement adapter selection and request routing
+    adapter = AdapterFactory.get_adapter_for_model(request.model)
+    if adapter is None:
         raise HTTPException(
-            status_code=501,
-            detail="Embeddings endpoint not yet implemented"
+            status_code=400,
+            detail=f"Unsupported model: {request.model}"
         )
+
+    # Routing metadata for the metrics/logging middleware
+    ctx = http_request.state.ctx
+    ctx.provider = adapter.provider_label
+    ctx.model = request.model
+
+    # Single dump of only the fields the client sent (see chat.py).
+    payload = request.model_dump(exclude_unset=True, exclude_none=True)
+
+    try:
+        # See chat.py: skip response-model re-validation on the hot path.
+        return ORJSONResponse(await adapter.create_embedding(payload))
+    except NotImplementedError as e:
+        raise HTTPException(status_code=501, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,19 +1,78 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+import inspect
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter
+from app.adapters.factory import AdapterFactory, configured_providers
 from app.schemas.responses import ModelsResponse
+from app.utils.logger import setup_logging
+
+logger = setup_logging()
 
 router = APIRouter()
 
+# The aggregated catalogue changes on deploys, not per request; a short
+# TTL turns the N-provider fan-out into a memory read for almost every
+# call. The lock keeps concurrent misses from all hitting upstream.
+MODELS_CACHE_TTL_SECONDS = 60.0
+_models_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_models_lock = asyncio.Lock()
+
+
+async def _provider_models(provider: str) -> List:
+    """
+    Fetch one provider's model list.
+
+    list_models is sync for adapters with static catalogues and async
+    for those that query upstream, so the result is awaited only when
+    needed.
+    """
+    adapter = AdapterFactory.get_adapter(provider)
+    if adapter is None:
+        return []
+    result = adapter.list_models()
+    if inspect.isawaitable(result):
+        result = await result
+    return list(result["data"])
+
 
 @router.get("/models", response_model=ModelsResponse)
 async def list_models():
     """
     List all available models across all configured providers.
+
+    Provider fetches run concurrently, so latency is bounded by the
+    slowest provider rather than the sum of all of them; a failing
+    provider is logged and skipped instead of failing the endpoint.
+    The aggregated response is cached for MODELS_CACHE_TTL_SECONDS.
     """
-    try:
-        # TODO: Implement model listing from all adapters
-        raise HTTPException(
-            status_code=501,
-            detail="Models listing endpoint not yet implemented"
+    global _models_cache
+    cached = _models_cache
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < MODELS_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    async with _models_lock:
+        # Another coroutine may have refreshed while we waited.
+        cached = _models_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < MODELS_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        providers = configured_providers()
+        results = await asyncio.gather(
+            *(_provider_models(p) for p in providers), return_exceptions=True
         )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        all_models = []
+        for provider, result in zip(providers, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "model listing failed",
+                    extra={"_extra": {"provider": provider, "error": str(result)}},
+                )
+                continue
+            all_models.extend(result)
+        payload = {"object": "list", "data": all_models}
+        _models_cache = (now, payload)
+        return payload
@@ -39,7 +39,9 @@ class EmbeddingResponse(BaseModel):
 class ModelInfo(BaseModel):
     id: str
     object: str = "model"
-    created: int
+    # Static provider catalogues carry no creation date; 0 keeps the
+    # OpenAI field shape without inventing one.
+    created: int = 0
     owned_by: str
 
 
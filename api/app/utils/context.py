@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class RequestCtx:
+    """
+    Per-request routing and accounting state.
+
+    Created once by the unified middleware and shared through
+    scope["state"]["ctx"]; routers fill in what they learn and the
+    middleware reads it back when the response finishes. Slotted
+    attribute access replaces the per-field getattr-with-default
+    lookups on request.state.
+    """
+
+    request_id: str = ""
+    provider: str = "unknown"
+    model: str = "unknown"
+    is_streaming: bool = False
+    usage: Any = None
@@ -0,0 +1,26 @@
+from typing import Optional
+
+
+class ProviderError(Exception):
+    """
+    Normalized failure from an upstream AI provider.
+
+    Carries the structured fields retry/backoff logic needs (kind,
+    status, retry_after) so callers never have to re-parse exception
+    strings. Always raised with `from` so the original SDK exception
+    stays on the chain.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        message: str,
+        kind: str = "api_error",
+        status: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(f"{provider}: {message}")
+        self.provider = provider
+        self.kind = kind
+        self.status = status
+        self.retry_after = retry_after
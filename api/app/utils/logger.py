@@ -0,0 +1,70 @@
+import logging
+import queue
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+import orjson
+from app.config import settings
+
+_listener: Optional[QueueListener] = None
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Format log records as single-line JSON for the log aggregator.
+
+    Structured fields are passed by producers under extra={"_extra": {...}}
+    and merged into the record verbatim.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        # record.created is already captured; formatting it directly is
+        # far cheaper than constructing a datetime per record.
+        log_data = {
+            "timestamp": time.strftime(
+                "%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)
+            ) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        extra = getattr(record, "_extra", None)
+        if extra:
+            log_data.update(extra)
+        if record.exc_info:
+            log_data["exception"] = self.formatException(record.exc_info)
+        return orjson.dumps(log_data).decode()
+
+
+def setup_logging() -> logging.Logger:
+    """
+    Configure and return the application logger.
+
+    Log records are handed off through an unbounded queue; a dedicated
+    listener thread formats and writes them, so the event loop never
+    blocks on a stdout write.
+    """
+    global _listener
+    logger = logging.getLogger("choreoai")
+    if not logger.handlers:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(JSONFormatter())
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        logger.setLevel(settings.LOG_LEVEL)
+        logger.propagate = False
+        _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+    return logger
+
+
+def shutdown_logging() -> None:
+    """
+    Drain the log queue and stop the listener thread; call at shutdown.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None